@@ -5,37 +5,260 @@ Qord
 A high level library for building Discord bots.
 """
 
-from qord import events, utils
-from qord.bases import *
-from qord.decorators import *
-from qord.enums import *
-from qord.exceptions import *
-from qord.project_info import *
-from qord.core.cache import *
-from qord.core.cache_impl import *
-from qord.core.client import *
-from qord.core.shard import *
-from qord.flags.base import *
-from qord.flags.intents import *
-from qord.flags.permissions import *
-from qord.flags.users import *
-from qord.flags.system_channel import *
-from qord.flags.messages import *
-from qord.flags.applications import *
-from qord.models.base import *
-from qord.models.channels import *
-from qord.models.users import *
-from qord.models.guilds import *
-from qord.models.guild_members import *
-from qord.models.roles import *
-from qord.models.messages import *
-from qord.models.emojis import *
-from qord.models.applications import *
-from qord.models.scheduled_events import *
-from qord.models.stage_instances import *
-from qord.models.invites import *
-from qord.dataclasses.allowed_mentions import *
-from qord.dataclasses.embeds import *
-from qord.dataclasses.files import *
-from qord.dataclasses.message_reference import *
-from qord.dataclasses.permission_overwrite import *
+from __future__ import annotations
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from qord import (
+        bases,
+        core,
+        dataclasses,
+        decorators,
+        enums,
+        events,
+        exceptions,
+        flags,
+        internal,
+        models,
+        project_info,
+        utils,
+    )
+    from qord.bases import *
+    from qord.decorators import *
+    from qord.enums import *
+    from qord.exceptions import *
+    from qord.core.cache import *
+    from qord.core.cache_impl import *
+    from qord.core.client import *
+    from qord.core.shard import *
+    from qord.flags.base import *
+    from qord.flags.intents import *
+    from qord.flags.permissions import *
+    from qord.flags.users import *
+    from qord.flags.system_channel import *
+    from qord.flags.messages import *
+    from qord.flags.applications import *
+    from qord.models.base import *
+    from qord.models.channels import *
+    from qord.models.users import *
+    from qord.models.guilds import *
+    from qord.models.guild_members import *
+    from qord.models.roles import *
+    from qord.models.messages import *
+    from qord.models.emojis import *
+    from qord.models.applications import *
+    from qord.models.scheduled_events import *
+    from qord.models.stage_instances import *
+    from qord.models.invites import *
+    from qord.dataclasses.allowed_mentions import *
+    from qord.dataclasses.embeds import *
+    from qord.dataclasses.files import *
+    from qord.dataclasses.message_reference import *
+    from qord.dataclasses.permission_overwrite import *
+
+
+# Public names are imported lazily on first access (PEP 562) so that
+# importing the package does not pay for loading every submodule. The
+# submodules are also resolved on access as they used to be available
+# as attributes after importing the package.
+_LAZY_SUBMODULES = (
+    "bases",
+    "core",
+    "dataclasses",
+    "decorators",
+    "enums",
+    "events",
+    "exceptions",
+    "flags",
+    "internal",
+    "models",
+    "project_info",
+    "utils",
+)
+_LAZY_MODULES: typing.Dict[str, typing.Tuple[str, ...]] = {
+    "qord.bases": (
+        "BaseMessageChannel",
+    ),
+    "qord.decorators": (
+        "event",
+    ),
+    "qord.enums": (
+        "GatewayEvent",
+        "PremiumType",
+        "DefaultAvatar",
+        "ImageExtension",
+        "VerificationLevel",
+        "NotificationLevel",
+        "ExplicitContentFilter",
+        "NSFWLevel",
+        "PremiumTier",
+        "MFALevel",
+        "ChannelType",
+        "VideoQualityMode",
+        "MessageType",
+        "TimestampStyle",
+        "ChannelPermissionType",
+        "EventPrivacyLevel",
+        "EventEntityType",
+        "EventStatus",
+        "StagePrivacyLevel",
+        "TeamMembershipState",
+        "InviteTargetType",
+    ),
+    "qord.exceptions": (
+        "QordException",
+        "ClientSetupRequired",
+        "HTTPException",
+        "HTTPBadRequest",
+        "HTTPForbidden",
+        "HTTPNotFound",
+        "HTTPServerError",
+        "ShardException",
+        "ShardCloseException",
+        "MissingPrivilegedIntents",
+    ),
+    "qord.core.cache": (
+        "ClientCache",
+        "GuildCache",
+    ),
+    "qord.core.cache_impl": (
+        "DefaultClientCache",
+        "DefaultGuildCache",
+        "NullClientCache",
+    ),
+    "qord.core.client": (
+        "Client",
+    ),
+    "qord.core.shard": (
+        "Shard",
+    ),
+    "qord.flags.base": (
+        "Flags",
+    ),
+    "qord.flags.intents": (
+        "Intents",
+    ),
+    "qord.flags.permissions": (
+        "Permissions",
+    ),
+    "qord.flags.users": (
+        "UserFlags",
+    ),
+    "qord.flags.system_channel": (
+        "SystemChannelFlags",
+    ),
+    "qord.flags.messages": (
+        "MessageFlags",
+    ),
+    "qord.flags.applications": (
+        "ApplicationFlags",
+    ),
+    "qord.models.base": (
+        "BaseModel",
+    ),
+    "qord.models.channels": (
+        "ChannelPermission",
+        "GuildChannel",
+        "TextChannel",
+        "NewsChannel",
+        "CategoryChannel",
+        "VoiceChannel",
+        "StageChannel",
+        "PrivateChannel",
+        "DMChannel",
+    ),
+    "qord.models.users": (
+        "User",
+        "ClientUser",
+    ),
+    "qord.models.guilds": (
+        "Guild",
+    ),
+    "qord.models.guild_members": (
+        "GuildMember",
+    ),
+    "qord.models.roles": (
+        "Role",
+    ),
+    "qord.models.messages": (
+        "ChannelMention",
+        "Reaction",
+        "Attachment",
+        "Message",
+    ),
+    "qord.models.emojis": (
+        "PartialEmoji",
+        "Emoji",
+    ),
+    "qord.models.applications": (
+        "ApplicationInstallParams",
+        "Application",
+        "Team",
+        "TeamMember",
+    ),
+    "qord.models.scheduled_events": (
+        "ScheduledEvent",
+    ),
+    "qord.models.stage_instances": (
+        "StageInstance",
+    ),
+    "qord.models.invites": (
+        "PartialInviteGuild",
+        "PartialInviteChannel",
+        "PartialInviteApplication",
+        "Invite",
+    ),
+    "qord.dataclasses.allowed_mentions": (
+        "AllowedMentions",
+    ),
+    "qord.dataclasses.embeds": (
+        "Embed",
+        "EmbedImage",
+        "EmbedThumbnail",
+        "EmbedProvider",
+        "EmbedVideo",
+        "EmbedAuthor",
+        "EmbedFooter",
+        "EmbedField",
+    ),
+    "qord.dataclasses.files": (
+        "File",
+    ),
+    "qord.dataclasses.message_reference": (
+        "MessageReference",
+    ),
+    "qord.dataclasses.permission_overwrite": (
+        "PermissionOverwrite",
+    ),
+}
+_LAZY_NAMES: typing.Dict[str, str] = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+__all__ = _LAZY_SUBMODULES + tuple(_LAZY_NAMES)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_SUBMODULES:
+        # Nested modules (e.g. qord.core.client) were reachable through
+        # these attributes when everything was imported eagerly, so all
+        # of them are loaded the first time a submodule is accessed.
+        for module in _LAZY_MODULES:
+            importlib.import_module(module)
+
+        return importlib.import_module(f"{__name__}.{name}")
+
+    try:
+        module = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -53,6 +53,10 @@ class BaseMessageChannel(ABC):
     """
     _rest: RestClient
 
+    # Subclasses that are the channel messages are sent in themselves set
+    # this to True so the asynchronous _get_message_channel() lookup is skipped.
+    _is_message_channel: typing.ClassVar[bool] = False
+
     @abstractmethod
     async def _get_message_channel(self) -> typing.Any:
         raise NotImplementedError
@@ -79,7 +83,7 @@ class BaseMessageChannel(ABC):
         HTTPException
             The fetching failed.
         """
-        channel = await self._get_message_channel()
+        channel = self if self._is_message_channel else await self._get_message_channel()
         data = await self._rest.get_message(channel_id=channel.id, message_id=message_id)
         return Message(data, channel=channel)
 
@@ -98,7 +102,7 @@ class BaseMessageChannel(ABC):
         HTTPException
             The fetching failed.
         """
-        channel = await self._get_message_channel()
+        channel = self if self._is_message_channel else await self._get_message_channel()
         data = await self._rest.get_pinned_messages(channel_id=channel.id)
         return [Message(item, channel=channel) for item in data]
 
@@ -139,7 +143,7 @@ class BaseMessageChannel(ABC):
         :class:`Message`
             The message from the channel.
         """
-        channel = await self._get_message_channel()
+        channel = self if self._is_message_channel else await self._get_message_channel()
 
         if any((
             before and after,
@@ -287,7 +291,7 @@ class BaseMessageChannel(ABC):
             else:
                 json["embeds"] = [embed.to_dict() for embed in embeds]
 
-        channel = await self._get_message_channel()
+        channel = self if self._is_message_channel else await self._get_message_channel()
         data = await self._rest.send_message(
             channel_id=channel.id,
             json=json,
@@ -310,7 +314,7 @@ class BaseMessageChannel(ABC):
         HTTPException
             Triggering typing failed.
         """
-        channel = await self._get_message_channel()
+        channel = self if self._is_message_channel else await self._get_message_channel()
         await self._rest.trigger_typing(channel_id=channel.id)
 
     def typing(self) -> TypingContextManager:
@@ -22,7 +22,6 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 import typing
 
 if typing.TYPE_CHECKING:
@@ -42,7 +41,7 @@ __all__ = (
     "GuildCache",
 )
 
-class ClientCache(ABC):
+class ClientCache:
     """Cache handler for a :class:`Client`.
 
     This cache handler stores the global entities such as guilds, users, messages
@@ -51,9 +50,13 @@ class ClientCache(ABC):
     In a :class:`Client`, This can be accessed through the :attr:`~Client.cache` attribute.
 
     In order to implement custom cache handlers, This class must be inherited and all
-    abstract methods should be implemented. The instance of this class is passed in
+    the methods should be implemented. The instance of this class is passed in
     the ``cache`` parameter of :class:`Client` initialization.
 
+    The methods returning multiple entities such as :meth:`.users` return a collection
+    that may be a live view of the cache that changes as the cache is updated. Consider
+    converting it to a :class:`list` if a snapshot is needed.
+
     Example::
 
         class MyCache(qord.ClientCache):
@@ -67,45 +70,83 @@ class ClientCache(ABC):
     message_limit: :class:`builtins.int`
         The number of messages to cache at a time. Defaults to ``100``. ``None`` or
         ``0`` will disable message cache.
+    user_limit: Optional[:class:`builtins.int`]
+        The maximum number of users to cache at a time. Once the limit is reached,
+        the least recently used users are removed from the cache. Defaults to ``None``
+        which means the number of users is not bounded.
 
     Attributes
     ----------
-    message_limit: :class:`builtins.int`
-        The number of messages to cache at a time.
+    message_cache_enabled: :class:`builtins.bool`
+        Indicates whether the message cache is enabled. This is updated
+        whenever :attr:`.message_limit` is set.
     """
+    __slots__ = ("_message_limit", "message_cache_enabled", "_user_limit")
+
+    def __init__(
+        self,
+        message_limit: typing.Optional[int] = 100,
+        user_limit: typing.Optional[int] = None,
+    ) -> None:
+        if user_limit is not None:
+            if type(user_limit) is not int:
+                raise TypeError("user_limit parameter must be an integer or None.")
+            if user_limit < 1:
+                raise ValueError("user_limit parameter must be greater than 0.")
+
+        self.message_limit = message_limit # type: ignore
+        self._user_limit = user_limit
 
-    def __init__(self, message_limit: int = 100) -> None:
-        if not isinstance(message_limit, int):
-            raise TypeError("message_limit parameter must be an integer.")
+    @property
+    def message_limit(self) -> int:
+        """The number of messages to cache at a time.
+
+        This can be set to change the limit. Setting it to ``None`` or ``0``
+        disables the message cache.
+
+        Returns
+        -------
+        :class:`builtins.int`
+        """
+        return self._message_limit
+
+    @message_limit.setter
+    def message_limit(self, message_limit: typing.Optional[int]) -> None:
         if message_limit is None:
             message_limit = 0
+        # bool is a subclass of int but is not a valid limit.
+        if type(message_limit) is not int:
+            raise TypeError("message_limit parameter must be an integer.")
 
-        self.message_limit = message_limit
+        self._message_limit = message_limit
+        self.message_cache_enabled = message_limit > 0
 
     @property
-    def message_cache_enabled(self) -> bool:
-        """Indicates whether the message cache is enabled.
+    def user_limit(self) -> typing.Optional[int]:
+        """The maximum number of users to cache at a time.
+
+        ``None`` means that the number of users is not bounded. This
+        can only be set when initializing the cache handler.
 
         Returns
         -------
-        :class:`builtins.bool`
+        Optional[:class:`builtins.int`]
         """
-        return self.message_limit > 0
+        return self._user_limit
 
-    @abstractmethod
     def clear(self) -> None:
         """Clears the entire cache."""
+        raise NotImplementedError
 
-    @abstractmethod
-    def users(self) -> typing.List[User]:
+    def users(self) -> typing.Collection[User]:
         """Returns all users that are currently cached.
 
         Returns
         -------
-        List[:class:`User`]
+        Collection[:class:`User`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_user(self, user_id: int) -> typing.Optional[User]:
         """Gets a :class:`User` from the cache with provided user ID.
 
@@ -120,8 +161,8 @@ class ClientCache(ABC):
             The gotten user if found. If no user existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_user(self, user: User) -> None:
         """Adds a :class:`User` to the cache.
 
@@ -130,8 +171,23 @@ class ClientCache(ABC):
         user: :class:`User`
             The user to add in the cache.
         """
+        raise NotImplementedError
+
+    def add_users(self, users: typing.Iterable[User]) -> None:
+        """Adds multiple :class:`User` objects to the cache.
+
+        This method has a default implementation that calls :meth:`.add_user`
+        for each user. Cache handlers may override it to insert the users
+        in a single operation.
+
+        Parameters
+        ----------
+        users: Iterable[:class:`User`]
+            The users to add in the cache.
+        """
+        for user in users:
+            self.add_user(user)
 
-    @abstractmethod
     def delete_user(self, user_id: int) -> typing.Optional[User]:
         """Removes a :class:`User` from the cache from the given ID.
 
@@ -146,17 +202,17 @@ class ClientCache(ABC):
             The deleted user if any. If no user existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def guilds(self) -> typing.List[Guild]:
+    def guilds(self) -> typing.Collection[Guild]:
         """Returns all guilds that are currently cached.
 
         Returns
         -------
-        List[:class:`Guild`]
+        Collection[:class:`Guild`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_guild(self, guild_id: int) -> typing.Optional[Guild]:
         """Gets a :class:`Guild` from the cache with provided guild ID.
 
@@ -171,8 +227,8 @@ class ClientCache(ABC):
             The gotten guild if found. If no guild existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_guild(self, guild: Guild) -> None:
         """Adds a :class:`Guild` to the cache.
 
@@ -181,8 +237,8 @@ class ClientCache(ABC):
         guild: :class:`Guild`
             The guild to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_guild(self, guild_id: int) -> typing.Optional[Guild]:
         """Removes a :class:`Guild` from the cache from the given ID.
 
@@ -197,32 +253,32 @@ class ClientCache(ABC):
             The deleted guild if any. If no guild existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def messages(self) -> typing.List[Message]:
+    def messages(self) -> typing.Collection[Message]:
         """Gets all messages that are currently cached.
 
         Returns
         -------
-        List[:class:`Message`]
+        Collection[:class:`Message`]
             The list of messages cached.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_message(self, message: Message) -> None:
         """Adds a :class:`Message` to the cache.
 
-        Once the :attr:`.message_limit` is reached, The messages
-        that are previously cache are removed, Clearing the message
-        cache.
+        Once the :attr:`.message_limit` is reached, The least recently
+        used message is removed from the cache to make space for the
+        new message.
 
         Parameters
         ----------
         message: :class:`Message`
             The message to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_message(self, message_id: int) -> typing.Optional[Message]:
         """Gets a :class:`Message` from the cache by the provided message ID.
 
@@ -237,8 +293,8 @@ class ClientCache(ABC):
             The gotten message if any. If no message existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_message(self, message_id: int) -> typing.Optional[Message]:
         """Deletes a :class:`Message` from the cache by the provided message ID.
 
@@ -253,18 +309,37 @@ class ClientCache(ABC):
             The deleted message if any. If no message existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
+
+    def messages_in(self, channel_id: int) -> typing.Collection[Message]:
+        """Gets all cached messages that belong to the provided channel.
+
+        This method has a default implementation that filters the messages
+        returned by :meth:`.messages`. Cache handlers are encouraged to override
+        it with a more efficient lookup.
 
-    @abstractmethod
-    def private_channels(self) -> typing.List[PrivateChannel]:
+        Parameters
+        ----------
+        channel_id: :class:`builtins.int`
+            The ID of channel to get messages for.
+
+        Returns
+        -------
+        Collection[:class:`Message`]
+            The messages cached for the channel.
+        """
+        return [message for message in self.messages() if message.channel_id == channel_id]
+
+    def private_channels(self) -> typing.Collection[PrivateChannel]:
         """Gets all private channels that are currently cached.
 
         Returns
         -------
-        List[:class:`PrivateChannel`]
+        Collection[:class:`PrivateChannel`]
             The list of private channels cached.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_private_channel(self, private_channel: PrivateChannel) -> None:
         """Adds a :class:`PrivateChannel` to the cache.
 
@@ -273,8 +348,8 @@ class ClientCache(ABC):
         private_channel: :class:`Message`
             The private channel to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
         """Gets a :class:`PrivateChannel` from the cache by the provided channel ID.
 
@@ -289,8 +364,8 @@ class ClientCache(ABC):
             The gotten channel if any. If no private channel existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
         """Deletes a :class:`PrivateChannel` from the cache by the provided channel ID.
 
@@ -305,9 +380,88 @@ class ClientCache(ABC):
             The deleted channel if any. If no private channel existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
+
+    def sweep_users(self, predicate: typing.Callable[[User], bool]) -> int:
+        """Removes the cached users that satisfy the given predicate.
+
+        This can be used to periodically evict the users that are no
+        longer needed to keep the memory usage of long running bots
+        in check. Unlike other methods, This method has a default
+        implementation that relies on :meth:`.users` and :meth:`.delete_user`.
+
+        Parameters
+        ----------
+        predicate: Callable[[:class:`User`], :class:`builtins.bool`]
+            The function that takes a cached user and returns a boolean
+            indicating whether it should be removed.
+
+        Returns
+        -------
+        :class:`builtins.int`
+            The number of users that were removed.
+        """
+        removed = [item for item in self.users() if predicate(item)]
+
+        for item in removed:
+            self.delete_user(item.id)
+
+        return len(removed)
+
+    def sweep_messages(self, predicate: typing.Callable[[Message], bool]) -> int:
+        """Removes the cached messages that satisfy the given predicate.
+
+        This can be used to periodically evict the messages that are no
+        longer needed to keep the memory usage of long running bots
+        in check. Unlike other methods, This method has a default
+        implementation that relies on :meth:`.messages` and :meth:`.delete_message`.
+
+        Parameters
+        ----------
+        predicate: Callable[[:class:`Message`], :class:`builtins.bool`]
+            The function that takes a cached message and returns a boolean
+            indicating whether it should be removed.
+
+        Returns
+        -------
+        :class:`builtins.int`
+            The number of messages that were removed.
+        """
+        removed = [item for item in self.messages() if predicate(item)]
+
+        for item in removed:
+            self.delete_message(item.id)
+
+        return len(removed)
+
+    def sweep_private_channels(self, predicate: typing.Callable[[PrivateChannel], bool]) -> int:
+        """Removes the cached private channels that satisfy the given predicate.
+
+        This can be used to periodically evict the private channels that are no
+        longer needed to keep the memory usage of long running bots
+        in check. Unlike other methods, This method has a default
+        implementation that relies on :meth:`.private_channels` and :meth:`.delete_private_channel`.
+
+        Parameters
+        ----------
+        predicate: Callable[[:class:`PrivateChannel`], :class:`builtins.bool`]
+            The function that takes a cached private channel and returns a boolean
+            indicating whether it should be removed.
+
+        Returns
+        -------
+        :class:`builtins.int`
+            The number of private channels that were removed.
+        """
+        removed = [item for item in self.private_channels() if predicate(item)]
+
+        for item in removed:
+            self.delete_private_channel(item.id)
 
+        return len(removed)
 
-class GuildCache(ABC):
+
+class GuildCache:
     """Cache handler for a :class:`Guild`.
 
     This cache handler stores entites related to a specific guild such as channels,
@@ -316,9 +470,13 @@ class GuildCache(ABC):
     In a :class:`Guild`, This can be accessed through the :attr:`~Guild.cache` attribute.
 
     In order to implement custom cache handlers, This class must be inherited and all
-    abstract methods should be implemented. The instance of this class should be returned
+    the methods should be implemented. The instance of this class should be returned
     by the :meth:`Client.get_guild_cache` method.
 
+    The methods returning multiple entities such as :meth:`.members` return a collection
+    that may be a live view of the cache that changes as the cache is updated. Consider
+    converting it to a :class:`list` if a snapshot is needed.
+
     Example::
 
         class MyGuildCache(qord.GuildCache):
@@ -332,15 +490,24 @@ class GuildCache(ABC):
     ----------
     guild: :class:`Guild`
         The guild that this cache handler belongs to.
+
+    Attributes
+    ----------
+    guild: :class:`Guild`
+        The guild that this cache handler belongs to.
+    guild_id: :class:`builtins.int`
+        The ID of guild that this cache handler belongs to.
     """
+    __slots__ = ("guild", "guild_id")
+
     def __init__(self, guild: Guild) -> None:
         self.guild = guild
+        self.guild_id = guild.id
 
-    @abstractmethod
     def clear(self) -> None:
         """Clears the entire cache."""
+        raise NotImplementedError
 
-    @abstractmethod
     def roles(self) -> typing.List[Role]:
         """Returns all roles that are currently cached.
 
@@ -348,8 +515,8 @@ class GuildCache(ABC):
         -------
         List[:class:`Role`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_role(self, role_id: int) -> typing.Optional[Role]:
         """Gets a :class:`Role` from the cache with provided role ID.
 
@@ -364,8 +531,8 @@ class GuildCache(ABC):
             The gotten role if found. If no role existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_role(self, role: Role) -> None:
         """Adds a :class:`Role` to the cache.
 
@@ -374,8 +541,23 @@ class GuildCache(ABC):
         role: :class:`Role`
             The role to add in the cache.
         """
+        raise NotImplementedError
+
+    def add_roles(self, roles: typing.Iterable[Role]) -> None:
+        """Adds multiple :class:`Role` objects to the cache.
+
+        This method has a default implementation that calls :meth:`.add_role`
+        for each role. Cache handlers may override it to insert the roles
+        in a single operation.
+
+        Parameters
+        ----------
+        roles: Iterable[:class:`Role`]
+            The roles to add in the cache.
+        """
+        for role in roles:
+            self.add_role(role)
 
-    @abstractmethod
     def delete_role(self, role_id: int) -> typing.Optional[Role]:
         """Removes a :class:`Role` from the cache from the given ID.
 
@@ -390,17 +572,17 @@ class GuildCache(ABC):
             The deleted role if any. If no role existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def members(self) -> typing.List[GuildMember]:
+    def members(self) -> typing.Collection[GuildMember]:
         """Returns all members that are currently cached.
 
         Returns
         -------
-        List[:class:`GuildMember`]
+        Collection[:class:`GuildMember`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_member(self, user_id: int) -> typing.Optional[GuildMember]:
         """Gets a :class:`GuildMember` from the cache for provided user ID.
 
@@ -415,8 +597,8 @@ class GuildCache(ABC):
             The gotten member if found. If no member existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_member(self, member: GuildMember) -> None:
         """Adds a :class:`GuildMember` to the cache.
 
@@ -425,8 +607,23 @@ class GuildCache(ABC):
         member: :class:`GuildMember`
             The member to add in the cache.
         """
+        raise NotImplementedError
+
+    def add_members(self, members: typing.Iterable[GuildMember]) -> None:
+        """Adds multiple :class:`GuildMember` objects to the cache.
+
+        This method has a default implementation that calls :meth:`.add_member`
+        for each member. Cache handlers may override it to insert the members
+        in a single operation.
+
+        Parameters
+        ----------
+        members: Iterable[:class:`GuildMember`]
+            The members to add in the cache.
+        """
+        for member in members:
+            self.add_member(member)
 
-    @abstractmethod
     def delete_member(self, user_id: int) -> typing.Optional[GuildMember]:
         """Removes a :class:`GuildMember` from the cache for provided user ID.
 
@@ -441,9 +638,9 @@ class GuildCache(ABC):
             The deleted member if any. If no member existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
 
-    @abstractmethod
     def channels(self) -> typing.List[GuildChannel]:
         """Returns all channels that are currently cached.
 
@@ -451,8 +648,8 @@ class GuildCache(ABC):
         -------
         List[:class:`GuildChannel`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
         """Gets a :class:`GuildChannel` from the cache for provided channel ID.
 
@@ -467,8 +664,8 @@ class GuildCache(ABC):
             The gotten channel if found. If no channel existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_channel(self, channel: GuildChannel) -> None:
         """Adds a :class:`GuildChannel` to the cache.
 
@@ -477,8 +674,23 @@ class GuildCache(ABC):
         channel: :class:`GuildChannel`
             The channel to add in the cache.
         """
+        raise NotImplementedError
+
+    def add_channels(self, channels: typing.Iterable[GuildChannel]) -> None:
+        """Adds multiple :class:`GuildChannel` objects to the cache.
+
+        This method has a default implementation that calls :meth:`.add_channel`
+        for each channel. Cache handlers may override it to insert the channels
+        in a single operation.
+
+        Parameters
+        ----------
+        channels: Iterable[:class:`GuildChannel`]
+            The channels to add in the cache.
+        """
+        for channel in channels:
+            self.add_channel(channel)
 
-    @abstractmethod
     def delete_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
         """Removes a :class:`GuildChannel` from the cache for provided channel ID.
 
@@ -493,17 +705,17 @@ class GuildCache(ABC):
             The deleted channel if any. If no channel existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def emojis(self) -> typing.List[Emoji]:
+    def emojis(self) -> typing.Collection[Emoji]:
         """Returns all the emojis that are currently cached.
 
         Returns
         -------
-        List[:class:`Emoji`]
+        Collection[:class:`Emoji`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def set_emojis(self, emojis: typing.List[Emoji]) -> None:
         """Replaces the emojis cache with the given list of emojis.
 
@@ -515,8 +727,8 @@ class GuildCache(ABC):
         emojis: List[:class:`Emoji`]
             The list of emojis to set.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_emoji(self, emoji_id: int) -> typing.Optional[Emoji]:
         """Gets a :class:`Emoji` from the cache for provided emoji ID.
 
@@ -531,8 +743,8 @@ class GuildCache(ABC):
             The gotten emoji if found. If no emoji existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_emoji(self, emoji: Emoji) -> None:
         """Adds a :class:`Emoji` to the cache.
 
@@ -541,8 +753,8 @@ class GuildCache(ABC):
         emoji: :class:`Emoji`
             The emoji to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_emoji(self, emoji_id: int) -> typing.Optional[Emoji]:
         """Removes a :class:`Emoji` from the cache for provided emoji ID.
 
@@ -557,17 +769,17 @@ class GuildCache(ABC):
             The deleted emoji if found. If no emoji existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def scheduled_events(self) -> typing.List[ScheduledEvent]:
+    def scheduled_events(self) -> typing.Collection[ScheduledEvent]:
         """Returns all scheduled events that are currently cached.
 
         Returns
         -------
-        List[:class:`ScheduledEvent`]
+        Collection[:class:`ScheduledEvent`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_scheduled_event(self, scheduled_event_id: int) -> typing.Optional[ScheduledEvent]:
         """Gets a :class:`ScheduledEvent` from the cache for provided event ID.
 
@@ -582,8 +794,8 @@ class GuildCache(ABC):
             The gotten event if found. If no event existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_scheduled_event(self, scheduled_event: ScheduledEvent) -> None:
         """Adds a :class:`ScheduledEvent` to the cache.
 
@@ -592,8 +804,8 @@ class GuildCache(ABC):
         scheduled_event: :class:`ScheduledEvent`
             The event to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_scheduled_event(self, scheduled_event_id: int) -> typing.Optional[ScheduledEvent]:
         """Removes a :class:`ScheduledEvent` from the cache for provided event ID.
 
@@ -608,17 +820,17 @@ class GuildCache(ABC):
             The removed event if any. If no event existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
-    def stage_instances(self) -> typing.List[StageInstance]:
+    def stage_instances(self) -> typing.Collection[StageInstance]:
         """Returns all stage instances that are currently cached.
 
         Returns
         -------
-        List[:class:`StageInstance`]
+        Collection[:class:`StageInstance`]
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def get_stage_instance(self, stage_instance_id: int) -> typing.Optional[StageInstance]:
         """Gets a :class:`StageInstance` from the cache for provided instance ID.
 
@@ -633,8 +845,8 @@ class GuildCache(ABC):
             The gotten stage instance if found. If no instance existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def add_stage_instance(self, stage_instance: StageInstance) -> None:
         """Adds a :class:`StageInstance` to the cache.
 
@@ -643,8 +855,8 @@ class GuildCache(ABC):
         stage_instance: :class:`StageInstance`
             The stage instance to add in the cache.
         """
+        raise NotImplementedError
 
-    @abstractmethod
     def delete_stage_instance(self, stage_instance_id: int) -> typing.Optional[StageInstance]:
         """Removes a :class:`StageInstance` from the cache for provided ID.
 
@@ -659,3 +871,4 @@ class GuildCache(ABC):
             The removed stage instance if any. If none existed with provided ID,
             ``None`` is returned.
         """
+        raise NotImplementedError
@@ -33,14 +33,21 @@ from qord.models.emojis import Emoji
 from qord.models.scheduled_events import ScheduledEvent
 from qord.models.stage_instances import StageInstance
 
+from collections import OrderedDict
+from operator import attrgetter
 import weakref
 import typing
 
 __all__ = (
     "DefaultClientCache",
     "DefaultGuildCache",
+    "NullClientCache",
 )
 
+_POSITION_KEY = attrgetter("position")
+_PRIVATE_CHANNELS_LIMIT = 256
+
+
 class DefaultClientCache(ClientCache):
     """Default in-memory cache implementation of :class:`ClientClient`.
 
@@ -52,107 +59,251 @@ class DefaultClientCache(ClientCache):
         documentation.
     """
 
+    __slots__ = ("_users", "_private_channels", "_guilds", "_messages", "_channel_messages")
+
     def clear(self) -> None:
-        self._users = weakref.WeakValueDictionary()
-        self._private_channels = weakref.WeakValueDictionary()
+        # Without a limit, users are only kept alive by the objects (e.g.
+        # guild members) referencing them. With a limit, they are strongly
+        # referenced and evicted in least recently used order instead.
+        if self._user_limit is None:
+            self._users = weakref.WeakValueDictionary()
+        else:
+            self._users = OrderedDict()
+        self._private_channels: typing.OrderedDict[int, PrivateChannel] = OrderedDict()
         self._guilds = dict()
-        self._messages = dict()
+        self._messages: typing.OrderedDict[int, Message] = OrderedDict()
+        self._channel_messages: typing.Dict[int, typing.Dict[int, Message]] = {}
 
-    def users(self) -> typing.List[User]:
-        return list(self._users.values())
+    def users(self) -> typing.Collection[User]:
+        if self._user_limit is None:
+            # A weak dictionary's values() is a generator backed view, so
+            # it has to be materialized.
+            return list(self._users.values())
+
+        return self._users.values()
 
     def get_user(self, user_id: int) -> typing.Optional[User]:
-        if not isinstance(user_id, int):
-            raise TypeError("Parameter user_id must be an integer.")
+        user = self._users.get(user_id)
+
+        if user is not None and self._user_limit is not None:
+            self._users.move_to_end(user_id)
 
-        return self._users.get(user_id)
+        return user
 
     def add_user(self, user: User) -> None:
-        if not isinstance(user, User):
+        # The type checks are stripped when running with -O.
+        if __debug__ and not isinstance(user, User):
             raise TypeError("Parameter user must be an instance of User.")
 
-        self._users[user.id] = user
+        users = self._users
+        user_id = user.id
+        users[user_id] = user
 
-    def delete_user(self, user_id: int) -> typing.Optional[User]:
-        if not isinstance(user_id, int):
-            raise TypeError("Parameter user_id must be an integer.")
+        if self._user_limit is not None:
+            users.move_to_end(user_id)
+
+            if len(users) > self._user_limit:
+                users.popitem(last=False)
+
+    def add_users(self, users: typing.Iterable[User]) -> None:
+        items = {}
+
+        for user in users:
+            if __debug__ and not isinstance(user, User):
+                raise TypeError("users must be an iterable of User objects.")
+
+            items[user.id] = user
+
+        cache = self._users
+        cache.update(items)
+
+        if self._user_limit is not None:
+            for user_id in items:
+                cache.move_to_end(user_id)
 
+            while len(cache) > self._user_limit:
+                cache.popitem(last=False)
+
+    def delete_user(self, user_id: int) -> typing.Optional[User]:
         return self._users.pop(user_id, None)
 
-    def guilds(self) -> typing.List[Guild]:
-        return list(self._guilds.values())
+    def guilds(self) -> typing.Collection[Guild]:
+        return self._guilds.values()
 
     def get_guild(self, guild_id: int) -> typing.Optional[Guild]:
-        if not isinstance(guild_id, int):
-            raise TypeError("Parameter guild_id must be an integer.")
-
         return self._guilds.get(guild_id)
 
     def add_guild(self, guild: Guild) -> None:
-        if not isinstance(guild, Guild):
+        if __debug__ and not isinstance(guild, Guild):
             raise TypeError("Parameter guild must be an instance of Guild.")
 
         self._guilds[guild.id] = guild
 
     def delete_guild(self, guild_id: int) -> typing.Optional[Guild]:
-        if not isinstance(guild_id, int):
-            raise TypeError("Parameter guild_id must be an integer.")
-
         return self._guilds.pop(guild_id, None)
 
-    def messages(self) -> typing.List[Message]:
-        return list(self._messages.values())
+    def messages(self) -> typing.Collection[Message]:
+        return self._messages.values()
 
     def get_message(self, message_id: int) -> typing.Optional[Message]:
-        if not isinstance(message_id, int):
-            raise TypeError("Parameter message_id must be an integer.")
+        message = self._messages.get(message_id)
+
+        if message is not None:
+            self._messages.move_to_end(message_id)
 
-        return self._messages.get(message_id)
+        return message
 
     def add_message(self, message: Message) -> None:
-        if not isinstance(message, Message):
+        if __debug__ and not isinstance(message, Message):
             raise TypeError("Parameter message must be an instance of Message")
 
         messages = self._messages
+        message_id = message.id
+        messages[message_id] = message
+        messages.move_to_end(message_id)
 
-        if len(messages) >= self.message_limit:
-            messages.clear()
+        try:
+            self._channel_messages[message.channel_id][message_id] = message
+        except KeyError:
+            self._channel_messages[message.channel_id] = {message_id: message}
 
-        messages[message.id] = message
+        # Evict the least recently used messages. This is normally a single
+        # message unless the message_limit was lowered.
+        while len(messages) > self._message_limit:
+            _, evicted = messages.popitem(last=False)
+            self._remove_channel_message(evicted)
 
     def delete_message(self, message_id: int) -> typing.Optional[Message]:
-        if not isinstance(message_id, int):
-            raise TypeError("Parameter message_id must be an integer.")
+        message = self._messages.pop(message_id, None)
+
+        if message is not None:
+            self._remove_channel_message(message)
+
+        return message
+
+    def messages_in(self, channel_id: int) -> typing.Collection[Message]:
+        try:
+            return self._channel_messages[channel_id].values()
+        except KeyError:
+            return ()
+
+    def _remove_channel_message(self, message: Message) -> None:
+        channel_messages = self._channel_messages.get(message.channel_id)
+
+        if channel_messages is None:
+            return
+
+        channel_messages.pop(message.id, None)
 
-        return self._messages.pop(message_id, None)
+        if not channel_messages:
+            del self._channel_messages[message.channel_id]
 
-    def private_channels(self) -> typing.List[PrivateChannel]:
-        return list(self._private_channels.values())
+    def private_channels(self) -> typing.Collection[PrivateChannel]:
+        return self._private_channels.values()
 
     def add_private_channel(self, private_channel: PrivateChannel) -> None:
-        if not isinstance(private_channel, PrivateChannel):
+        if __debug__ and not isinstance(private_channel, PrivateChannel):
             raise TypeError("Parameter private_channel must be an instance of PrivateChannel")
 
         private_channels = self._private_channels
+        channel_id = private_channel.id
+        private_channels[channel_id] = private_channel
+        private_channels.move_to_end(channel_id)
 
-        if len(private_channels) >= 256:
-            private_channels.clear()
-
-        private_channels[private_channel.id] = private_channel
+        if len(private_channels) > _PRIVATE_CHANNELS_LIMIT:
+            # Evict the least recently used channel.
+            private_channels.popitem(last=False)
 
     def get_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
-        if not isinstance(channel_id, int):
-            raise TypeError("Parameter channel_id must be an integer.")
+        private_channel = self._private_channels.get(channel_id)
 
-        return self._private_channels.get(channel_id, None)
+        if private_channel is not None:
+            self._private_channels.move_to_end(channel_id)
 
-    def delete_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
-        if not isinstance(channel_id, int):
-            raise TypeError("Parameter channel_id must be an integer.")
+        return private_channel
 
+    def delete_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
         return self._private_channels.pop(channel_id, None)
 
 
+class NullClientCache(ClientCache):
+    """A :class:`ClientCache` implementation that does not cache anything.
+
+    This cache handler discards every entity passed to it and all lookups
+    on it return ``None``. This is useful for stateless bots that do not
+    rely on the cache at all and want to avoid the memory overhead of it.
+
+    .. warning::
+        Most of the gateway events require the relevant guild to be cached
+        in order to be dispatched. With this cache handler, such events are
+        never dispatched.
+    """
+
+    __slots__ = ()
+
+    _EMPTY: typing.Tuple[typing.Any, ...] = ()
+
+    def __init__(self) -> None:
+        super().__init__(message_limit=None)
+
+    def clear(self) -> None:
+        pass
+
+    def users(self) -> typing.Collection[User]:
+        return self._EMPTY
+
+    def get_user(self, user_id: int) -> typing.Optional[User]:
+        return None
+
+    def add_user(self, user: User) -> None:
+        pass
+
+    def add_users(self, users: typing.Iterable[User]) -> None:
+        pass
+
+    def delete_user(self, user_id: int) -> typing.Optional[User]:
+        return None
+
+    def guilds(self) -> typing.Collection[Guild]:
+        return self._EMPTY
+
+    def get_guild(self, guild_id: int) -> typing.Optional[Guild]:
+        return None
+
+    def add_guild(self, guild: Guild) -> None:
+        pass
+
+    def delete_guild(self, guild_id: int) -> typing.Optional[Guild]:
+        return None
+
+    def messages(self) -> typing.Collection[Message]:
+        return self._EMPTY
+
+    def get_message(self, message_id: int) -> typing.Optional[Message]:
+        return None
+
+    def add_message(self, message: Message) -> None:
+        pass
+
+    def delete_message(self, message_id: int) -> typing.Optional[Message]:
+        return None
+
+    def messages_in(self, channel_id: int) -> typing.Collection[Message]:
+        return self._EMPTY
+
+    def private_channels(self) -> typing.Collection[PrivateChannel]:
+        return self._EMPTY
+
+    def get_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
+        return None
+
+    def add_private_channel(self, private_channel: PrivateChannel) -> None:
+        pass
+
+    def delete_private_channel(self, channel_id: int) -> typing.Optional[PrivateChannel]:
+        return None
+
+
 class DefaultGuildCache(GuildCache):
     """Default in-memory cache implementation of :class:`GuildClient`.
 
@@ -164,6 +315,7 @@ class DefaultGuildCache(GuildCache):
         documentation.
     """
 
+    __slots__ = ("_roles", "_members", "_channels", "_emojis", "_scheduled_events", "_stage_instances")
 
     def clear(self) -> None:
         self._roles: typing.Dict[int, Role] = {}
@@ -177,142 +329,139 @@ class DefaultGuildCache(GuildCache):
         roles = list(self._roles.values())
         # Multiple roles may share same positions so
         # we cannot rely on this behaviour.
-        roles.sort(key=lambda role: role.position) # Undocumented, see above
+        roles.sort(key=_POSITION_KEY) # Undocumented, see above
         return roles
 
     def add_role(self, role: Role) -> None:
-        if not isinstance(role, Role):
+        if __debug__ and not isinstance(role, Role):
             raise TypeError("Parameter role must be an instance of Role.")
 
         self._roles[role.id] = role
 
-    def get_role(self, role_id: int) -> typing.Optional[Role]:
-        if not isinstance(role_id, int):
-            raise TypeError("Parameter role_id must be an integer.")
+    def add_roles(self, roles: typing.Iterable[Role]) -> None:
+        items = {}
+
+        for role in roles:
+            if __debug__ and not isinstance(role, Role):
+                raise TypeError("roles must be an iterable of Role objects.")
 
+            items[role.id] = role
+
+        self._roles.update(items)
+
+    def get_role(self, role_id: int) -> typing.Optional[Role]:
         return self._roles.get(role_id)
 
     def delete_role(self, role_id: int) -> typing.Optional[Role]:
-        if not isinstance(role_id, int):
-            raise TypeError("Parameter role_id must be an integer.")
-
         return self._roles.pop(role_id, None)
 
-    def members(self) -> typing.List[GuildMember]:
-        return list(self._members.values())
+    def members(self) -> typing.Collection[GuildMember]:
+        return self._members.values()
 
     def add_member(self, member: GuildMember) -> None:
-        if not isinstance(member, GuildMember):
+        if __debug__ and not isinstance(member, GuildMember):
             raise TypeError("Parameter member must be an instance of GuildMember.")
 
         self._members[member.user.id] = member
 
-    def get_member(self, user_id: int) -> typing.Optional[GuildMember]:
-        if not isinstance(user_id, int):
-            raise TypeError("Parameter user_id must be an integer.")
+    def add_members(self, members: typing.Iterable[GuildMember]) -> None:
+        items = {}
+
+        for member in members:
+            if __debug__ and not isinstance(member, GuildMember):
+                raise TypeError("members must be an iterable of GuildMember objects.")
 
+            items[member.user.id] = member
+
+        self._members.update(items)
+
+    def get_member(self, user_id: int) -> typing.Optional[GuildMember]:
         return self._members.get(user_id)
 
     def delete_member(self, user_id: int) -> typing.Optional[GuildMember]:
-        if not isinstance(user_id, int):
-            raise TypeError("Parameter user_id must be an integer.")
-
         return self._members.pop(user_id, None)
 
     def channels(self) -> typing.List[GuildChannel]:
         ret = list(self._channels.values())
         # Multiple channels may share the same position so
         # we cannot rely on this behaviour.
-        ret.sort(key=lambda c: c.position) # Undocumented, see above
+        ret.sort(key=_POSITION_KEY) # Undocumented, see above
         return ret
 
     def get_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
-        if not isinstance(channel_id, int):
-            raise TypeError("Parameter channel_id must be an integer.")
-
         return self._channels.get(channel_id)
 
     def add_channel(self, channel: GuildChannel) -> None:
-        if not isinstance(channel, GuildChannel):
+        if __debug__ and not isinstance(channel, GuildChannel):
             raise TypeError("Parameter channel must be an instance of GuildChannel.")
 
         self._channels[channel.id] = channel
 
-    def delete_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
-        if not isinstance(channel_id, int):
-            raise TypeError("Parameter channel_id must be an integer.")
+    def add_channels(self, channels: typing.Iterable[GuildChannel]) -> None:
+        items = {}
+
+        for channel in channels:
+            if __debug__ and not isinstance(channel, GuildChannel):
+                raise TypeError("channels must be an iterable of GuildChannel objects.")
+
+            items[channel.id] = channel
 
+        self._channels.update(items)
+
+    def delete_channel(self, channel_id: int) -> typing.Optional[GuildChannel]:
         return self._channels.pop(channel_id, None)
 
-    def emojis(self) -> typing.List[Emoji]:
-        return list(self._emojis.values())
+    def emojis(self) -> typing.Collection[Emoji]:
+        return self._emojis.values()
 
     def set_emojis(self, emojis: typing.List[Emoji]) -> None:
         cache = self._emojis
         cache.clear()
 
         for emoji in emojis:
-            if not isinstance(emoji, Emoji):
+            if __debug__ and not isinstance(emoji, Emoji):
                 raise TypeError("emojis must be a list of Emoji objects.")
 
             cache[emoji.id] = emoji
 
     def get_emoji(self, emoji_id: int) -> typing.Optional[Emoji]:
-        if not isinstance(emoji_id, int):
-            raise TypeError("Parameter emoji_id must be an integer.")
-
         return self._emojis.get(emoji_id)
 
     def add_emoji(self, emoji: Emoji) -> None:
-        if not isinstance(emoji, Emoji):
+        if __debug__ and not isinstance(emoji, Emoji):
             raise TypeError("Parameter emoji must be an instance of Emoji.")
 
         self._emojis[emoji.id] = emoji
 
     def delete_emoji(self, emoji_id: int) -> typing.Optional[Emoji]:
-        if not isinstance(emoji_id, int):
-            raise TypeError("Parameter emoji_id must be an integer.")
-
         return self._emojis.pop(emoji_id, None)
 
-    def scheduled_events(self) -> typing.List[ScheduledEvent]:
-        return list(self._scheduled_events.values())
+    def scheduled_events(self) -> typing.Collection[ScheduledEvent]:
+        return self._scheduled_events.values()
 
     def get_scheduled_event(self, scheduled_event_id: int) -> typing.Optional[ScheduledEvent]:
-        if not isinstance(scheduled_event_id, int):
-            raise TypeError("Parameter scheduled_event_id must be an integer.")
-
         return self._scheduled_events.get(scheduled_event_id)
 
     def add_scheduled_event(self, scheduled_event: ScheduledEvent) -> None:
-        if not isinstance(scheduled_event, ScheduledEvent):
+        if __debug__ and not isinstance(scheduled_event, ScheduledEvent):
             raise TypeError("Parameter scheduled_event must be an instance of ScheduledEvent.")
 
         self._scheduled_events[scheduled_event.id] = scheduled_event
 
     def delete_scheduled_event(self, scheduled_event_id: int) -> typing.Optional[ScheduledEvent]:
-        if not isinstance(scheduled_event_id, int):
-            raise TypeError("Parameter scheduled_event_id must be an integer.")
-
         return self._scheduled_events.pop(scheduled_event_id, None)
 
-    def stage_instances(self) -> typing.List[StageInstance]:
-        return list(self._stage_instances.values())
+    def stage_instances(self) -> typing.Collection[StageInstance]:
+        return self._stage_instances.values()
 
     def get_stage_instance(self, stage_instance_id: int) -> typing.Optional[StageInstance]:
-        if not isinstance(stage_instance_id, int):
-            raise TypeError("Parameter stage_instance_id must be an integer.")
-
         return self._stage_instances.get(stage_instance_id)
 
     def add_stage_instance(self, stage_instance: StageInstance) -> None:
-        if not isinstance(stage_instance, StageInstance):
+        if __debug__ and not isinstance(stage_instance, StageInstance):
             raise TypeError("Parameter stage_instance must be an instance of StageInstance.")
 
         self._stage_instances[stage_instance.id] = stage_instance
 
     def delete_stage_instance(self, stage_instance_id: int) -> typing.Optional[StageInstance]:
-        if not isinstance(stage_instance_id, int):
-            raise TypeError("Parameter stage_instance_id must be an integer.")
-
         return self._stage_instances.pop(stage_instance_id, None)
@@ -37,11 +37,12 @@ from qord.internal.undefined import UNDEFINED
 from qord.exceptions import ClientSetupRequired
 from qord.events.base import BaseEvent
 
+from collections import deque
 import asyncio
 import inspect
 import logging
-import traceback
 import typing
+import warnings
 
 if typing.TYPE_CHECKING:
     from aiohttp import ClientSession
@@ -58,6 +59,17 @@ __all__ = (
 )
 
 _LOGGER = logging.getLogger(__name__)
+_GATEWAY_QUERY = "?v=9&encoding=json&compress=zlib-stream"
+
+
+def _log_listener_exception(task: asyncio.Task[typing.Any]) -> None:
+    if task.cancelled():
+        return
+
+    exc = task.exception()
+
+    if exc is not None:
+        _LOGGER.error("Unhandled exception in event listener %r", task.get_coro(), exc_info=exc)
 
 
 class Client:
@@ -227,12 +239,19 @@ class Client:
         If the client is running multiple shards, This returns the average of
         latencies of all shards. See :attr:`Shard.latency` for more info.
 
+        If the client has no shards yet, This returns infinity, the same as
+        the latency of a shard that has not connected yet.
+
         Returns
         -------
         :class:`builtins.float`
         """
-        latencies = [shard.latency for shard in self._shards.values()]
-        return sum(latencies) / len(self._shards)
+        shards = self._shards
+
+        if not shards:
+            return float("inf")
+
+        return sum(shard._latency for shard in shards.values()) / len(shards)
 
     @property
     def max_concurrency(self) -> typing.Optional[int]:
@@ -376,7 +395,7 @@ class Client:
         callback:
             The callback listener. This must be a coroutine.
         """
-        if not asyncio.iscoroutinefunction(callback):
+        if not inspect.iscoroutinefunction(callback):
             raise TypeError("Parameter 'callback' must be a coroutine.")
 
         try:
@@ -384,12 +403,6 @@ class Client:
         except KeyError:
             self._event_listeners[event_name] = [callback]
 
-    async def _wrapped_callable(self, _callable: typing.Callable[..., typing.Any], *args) -> None:
-        try:
-            await _callable(*args)
-        except Exception:
-            traceback.print_exc()
-
     async def wait_for_event(
         self,
         event_name: str,
@@ -487,13 +500,23 @@ class Client:
         except AttributeError:
             raise TypeError("Parameter 'event' must be an instance of events.BaseEvent") from None
 
-        loop = asyncio.get_running_loop()
+        listeners = self._event_listeners.get(event_name)
+
+        if listeners:
+            create_task = asyncio.get_running_loop().create_task
+
+            for listener in listeners:
+                try:
+                    coro = listener(event)
+                except Exception:
+                    # Calling the listener can fail before a coroutine is
+                    # created, e.g. due to an invalid signature.
+                    _LOGGER.exception("Unhandled exception in event listener %r", listener)
+                    continue
 
-        listeners = self._event_listeners.get(event_name, [])
-        for listener in listeners:
-            loop.create_task(self._wrapped_callable(listener, event))
+                create_task(coro).add_done_callback(_log_listener_exception)
 
-        futures = self._event_futures.get(event_name, [])
+        futures = self._event_futures.get(event_name, ())
         for tup in futures:
             check, future = tup
             if check(event):
@@ -570,7 +593,7 @@ class Client:
 
         gateway = await self._rest.get_bot_gateway()
 
-        self._gateway_url = gateway["url"] + "?v=9&encoding=json&compress=zlib-stream"
+        self._gateway_url = gateway["url"] + _GATEWAY_QUERY
         self._max_concurrency = gateway["session_start_limit"]["max_concurrency"]
 
         if self._shards_count is None:
@@ -600,7 +623,7 @@ class Client:
 
         loop = asyncio.get_running_loop()
 
-        shards = self.shards
+        shards = deque(self._shards.values())
 
         _LOGGER.info(
             "Launching %s shards (%s shard%s concurrently per 5 seconds)",
@@ -619,7 +642,7 @@ class Client:
 
             for _ in range(self._max_concurrency): # type: ignore
                 try:
-                    shard = shards[0]
+                    shard = shards.popleft()
                 except IndexError:
                     # no more shards
                     break
@@ -628,20 +651,23 @@ class Client:
                         shard._wrapped_launch(self._gateway_url, future), # type: ignore
                         name=f"shard-worker:{shard._id}"
                     )
-                    shards.remove(shard)
-                    waiters.append(shard._identified.wait())
+                    waiters.append(loop.create_task(shard._identified.wait()))
 
-            # Ensure that all shards properly identify before delaying.
-            for waiter in waiters:
-                try:
-                    await asyncio.wait_for(waiter, timeout=self.connect_timeout)
-                except asyncio.TimeoutError:
-                    # Timed out waiting for a shard to start.
-                    _LOGGER.error("Timed out waiting for a shard to start.")
+            # Ensure that all shards properly identify before delaying. The
+            # shards are waited for together so that the timeout is shared
+            # rather than applied to each shard one after another.
+            _, pending = await asyncio.wait(waiters, timeout=self.connect_timeout)
+
+            if pending:
+                for waiter in pending:
+                    waiter.cancel()
+
+                # Timed out waiting for shards to start.
+                _LOGGER.error("Timed out waiting for %s shard(s) to start.", len(pending))
 
-                    # Check if we have an error
-                    if future.done():
-                        raise future.result()
+                # Check if we have an error
+                if future.done():
+                    raise future.result()
 
             if shards:
                 await asyncio.sleep(5)
@@ -649,7 +675,7 @@ class Client:
         # block until one of the shards crash
         self._closed = False
         self._notify_shards_launch()
-        exc = await asyncio.wait_for(future, timeout=None)
+        exc = await future
         raise exc
 
     async def close(self, *, clear_setup: bool = True) -> None:
@@ -674,8 +700,14 @@ class Client:
 
         _LOGGER.info("Gracefully closing %s shards.", self._shards_count)
 
-        for shard in self._shards.values():
-            await shard._close(code=1000, _clean=True)
+        results = await asyncio.gather(
+            *(shard._close(code=1000, _clean=True) for shard in self._shards.values()),
+            return_exceptions=True,
+        )
+
+        for shard, result in zip(self._shards.values(), results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to gracefully close shard %s.", shard._id, exc_info=result)
 
         dispatch_handler = self._dispatch
         dispatch_handler._shards_connected.clear()
@@ -696,6 +728,12 @@ class Client:
         granular control over the event loop, Consider using :meth:`.setup` and
         :meth:`.launch`
 
+        .. tip::
+
+            To run the client on a custom event loop implementation such as
+            ``uvloop``, install its event loop policy before calling this method
+            or call :meth:`.setup` and :meth:`.launch` from your own loop.
+
         Parameters
         ----------
         token: :class:`builtins.str`
@@ -712,18 +750,28 @@ class Client:
             await self.setup(token)
             await self.launch()
 
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
+        with warnings.catch_warnings():
+            # get_event_loop() warns on Python 3.10+ when no loop is set. The
+            # loop set by the user, if any, is still preferred here.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            try:
+                loop = asyncio.get_event_loop()
+            except RuntimeError:
+                loop = None
+
+        if loop is None or loop.is_closed():
             loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
 
         try:
             loop.run_until_complete(launcher())
         except KeyboardInterrupt:
             loop.run_until_complete(self.close())
         finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
             loop.stop()
             loop.close()
+            asyncio.set_event_loop(None)
 
     def is_ready(self) -> bool:
         """Indicates whether the client is ready.
@@ -782,6 +830,13 @@ class Client:
     async def fetch_user(self, user_id: int, /) -> User:
         """Fetches a :class:`User` by it's ID via REST API.
 
+        This method always makes an HTTP request.
+
+        .. tip::
+
+            If the user is likely to be cached, consider looking it up
+            with :meth:`ClientCache.get_user` first to avoid the request.
+
         Parameters
         ----------
         user_id: :class:`builtins.int`
@@ -805,6 +860,13 @@ class Client:
     async def fetch_guild(self, guild_id: int, /, *, with_counts: bool = False) -> Guild:
         """Fetches a :class:`Guild` by it's ID via REST API.
 
+        This method always makes an HTTP request.
+
+        .. tip::
+
+            If the bot is a member of the guild, consider looking it up
+            with :meth:`ClientCache.get_guild` first to avoid the request.
+
         Parameters
         ----------
         guild_id: :class:`builtins.int`
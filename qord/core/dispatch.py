@@ -303,7 +303,7 @@ class DispatchHandler:
             shard._log(logging.DEBUG, "GUILD_MEMBER_ADD: Unknown guild with ID %s", guild_id)
             return
 
-        member = GuildMember(data, guild=guild)
+        member = GuildMember(data, guild=guild, _share_user=True)
 
         guild._cache.add_member(member)
         self.cache.add_user(member.user)
@@ -331,7 +331,9 @@ class DispatchHandler:
             return
 
         before = copy.copy(member)
-        member._update_with_data(data)
+        # The user is updated in place so keep a snapshot of it as well.
+        before.user = copy.copy(member.user)
+        member._update_with_data(data, _share_user=True)
 
         event = events.GuildMemberUpdate(shard=shard, guild=guild, before=before, after=member)
         self.invoke(event)
@@ -452,7 +454,10 @@ class DispatchHandler:
 
         message = Message(data, channel=channel) # type: ignore
         event = events.MessageCreate(shard=shard, message=message)
-        self.cache.add_message(message)
+
+        if self.cache.message_cache_enabled:
+            self.cache.add_message(message)
+
         self.invoke(event)
 
     @event_dispatch_handler("MESSAGE_DELETE")
@@ -615,7 +620,7 @@ class DispatchHandler:
             return
 
         guild_cache = guild._cache
-        before = guild_cache.emojis().copy()
+        before = list(guild_cache.emojis())
         after = [Emoji(e, guild=guild) for e in data.get("emojis", [])]
 
         event = events.EmojisUpdate(
@@ -33,6 +33,7 @@ from qord.exceptions import (
 from qord.project_info import __version__, __github__
 from qord.core.ratelimits import Route, RatelimitHandler
 from qord.internal.undefined import UNDEFINED
+from qord.internal.helpers import json_loads
 
 import aiohttp
 import asyncio
@@ -99,7 +100,7 @@ class RestClient:
 
     async def _resolve_response(self, response):
         if response.headers["Content-Type"] == "application/json":
-            data = await response.json()
+            data = await response.json(loads=json_loads)
         else:
             data = await response.text()
 
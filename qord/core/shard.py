@@ -23,6 +23,7 @@
 from __future__ import annotations
 
 from qord.exceptions import MissingPrivilegedIntents, ShardCloseException
+from qord.internal.helpers import json_loads
 
 import asyncio
 import zlib
@@ -233,14 +234,16 @@ class Shard:
         await self._close(_clean=True)
 
     def _log(self, level: int, message: typing.Any, *args: typing.Any) -> None:
-        _LOGGER.log(level, f"[Shard {self._id}] {message}", *args)
+        # Avoid building the prefixed message for disabled levels.
+        if _LOGGER.isEnabledFor(level):
+            _LOGGER.log(level, f"[Shard {self._id}] {message}", *args)
 
-    def _decompress_message(self, message: bytes) -> typing.Any:
-        self._buffer.extend(message)
-        decomp = self._inflator.decompress(self._buffer) # type: ignore
-        self._buffer = bytearray()
+    def _decompress_message(self) -> bytes:
+        buffer = self._buffer
+        decomp = self._inflator.decompress(buffer) # type: ignore
+        buffer.clear()
 
-        return decomp.decode()
+        return decomp
 
     def _notify_waiters(self):
         # This is a hack to prevent timeout error when initially
@@ -253,19 +256,27 @@ class Shard:
         message = message.data
 
         if isinstance(message, bytes):
-            if len(message) > 4 and message[-4:] != _ZLIB_SUFFIX:
-                return
+            buffer = self._buffer
+            buffer.extend(message)
+
+            # A payload may be split across multiple messages, only
+            # the last one of them ends with the zlib suffix. True is
+            # returned to indicate that more data is needed.
+            if buffer[-4:] != _ZLIB_SUFFIX:
+                return True
 
-            message = self._decompress_message(message)
+            # The decompressed bytes are parsed as is below, without
+            # decoding them to a string first.
+            message = self._decompress_message()
 
         if isinstance(message, int):
             # Close code more then likely.
             return message
 
-        elif isinstance(message, str):
+        elif isinstance(message, (str, bytes)):
             try:
-                ret = json.loads(message)
-            except json.JSONDecodeError:
+                ret = json_loads(message)
+            except ValueError:
                 # message is not a valid JSON?
                 return message
             else:
@@ -285,6 +296,10 @@ class Shard:
     async def _handle_recv(self) -> typing.Any:
         packet = await self._receive()
 
+        if packet is True:
+            # Incomplete payload, wait for the rest of it.
+            return True
+
         if not packet:
             return
 
@@ -374,6 +389,7 @@ class Shard:
 
             self._websocket = await session.ws_connect(url)
             self._inflator = zlib.decompressobj()
+            self._buffer.clear()
 
             while True:
                 try:
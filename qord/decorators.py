@@ -23,6 +23,11 @@
 from __future__ import annotations
 
 
+__all__ = (
+    "event",
+)
+
+
 def event(event_name: str):
     """A decorator for registering event listeners in a :class:`Client`.
 
@@ -23,6 +23,31 @@
 from __future__ import annotations
 
 
+__all__ = (
+    "GatewayEvent",
+    "PremiumType",
+    "DefaultAvatar",
+    "ImageExtension",
+    "VerificationLevel",
+    "NotificationLevel",
+    "ExplicitContentFilter",
+    "NSFWLevel",
+    "PremiumTier",
+    "MFALevel",
+    "ChannelType",
+    "VideoQualityMode",
+    "MessageType",
+    "TimestampStyle",
+    "ChannelPermissionType",
+    "EventPrivacyLevel",
+    "EventEntityType",
+    "EventStatus",
+    "StagePrivacyLevel",
+    "TeamMembershipState",
+    "InviteTargetType",
+)
+
+
 class GatewayEvent:
     """An enumeration that details names of various events sent over gateway.
 
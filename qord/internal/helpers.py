@@ -27,8 +27,14 @@ from qord.internal.undefined import UNDEFINED
 
 from datetime import datetime, timezone
 from base64 import b64encode
+from functools import lru_cache
 import typing
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 __all__ = (
     "BASE_CDN_URL",
@@ -39,33 +45,49 @@ __all__ = (
     "compute_shard_id",
     "get_image_data",
     "parse_iso_timestamp",
+    "json_loads",
 )
 
 
 BASE_CDN_URL = "https://cdn.discordapp.com"
-BASIC_STATIC_EXTS = ["png", "jpg", "jpeg", "webp"]
-BASIC_EXTS = ["png", "jpg", "jpeg", "webp", "gif"]
-
-def create_cdn_url(path: str, extension: str, size: int = UNDEFINED, valid_exts: typing.List[str] = UNDEFINED):
+# These are immutable so they can be shared by all callers without copying
+# and can be hashed as part of create_cdn_url()'s cache key.
+BASIC_STATIC_EXTS = frozenset({"png", "jpg", "jpeg", "webp"})
+BASIC_EXTS = frozenset({"png", "jpg", "jpeg", "webp", "gif"})
+
+# Defaulting to general formats used on most endpoints which
+# are currently png, jpg, webp. When using with endpoints that
+# have special formats consider passing the valid formats explicitly.
+_DEFAULT_CDN_EXTS = BASIC_STATIC_EXTS
+
+# Data URI prefixes for the supported image types.
+_PNG_DATA_PREFIX = "data:image/png;base64,"
+_JPEG_DATA_PREFIX = "data:image/jpeg;base64,"
+_GIF_DATA_PREFIX = "data:image/gif;base64,"
+_WEBP_DATA_PREFIX = "data:image/webp;base64,"
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+_JPEG_MARKERS = (b"JFIF", b"Exif")
+
+
+# CDN URLs for a given asset hash never change so the generated
+# URLs are cached as the same assets are commonly requested repeatedly.
+@lru_cache(maxsize=1024)
+def create_cdn_url(path: str, extension: str, size: int = UNDEFINED, valid_exts: typing.FrozenSet[str] = UNDEFINED):
     """Create a CDN URL with provided path, file extension and size."""
+    valid_exts = valid_exts or _DEFAULT_CDN_EXTS
 
-    if valid_exts is None:
-        # Defaulting to general formats used on most endpoints which
-        # are currently png, jpg, webp.
-        # When using with endpoints that have special formats
-        # consider passing the valid formats explicitly.
-        valid_exts = BASIC_STATIC_EXTS
-
-    if not extension.lower() in valid_exts:
-        raise ValueError(f"Invalid image extension {extension!r}, Expected one of {', '.join(valid_exts)}")
+    # Extensions are commonly passed in lower case already so
+    # lowering is only done when the initial lookup fails.
+    if extension not in valid_exts and extension.lower() not in valid_exts:
+        raise ValueError(f"Invalid image extension {extension!r}, Expected one of {', '.join(sorted(valid_exts))}")
 
     ret = f"{BASE_CDN_URL}{path}.{extension}"
 
     if size is not UNDEFINED:
-        if size < 64 and size > 4096:
-            raise ValueError("size must be between 64 and 4096. Got %s instead." % size)
-        if not (size & (size-1) == 0) and (size != 0 and size-1 != 0):
-            raise ValueError("size must be a power of 2 between 64 and 4096, %s is invalid." % size)
+        if not (64 <= size <= 4096 and size & (size - 1) == 0):
+            raise ValueError(f"size must be a power of 2 between 64 and 4096, {size} is invalid.")
 
         return f"{ret}?size={size}"
 
@@ -73,9 +95,16 @@ def create_cdn_url(path: str, extension: str, size: int = UNDEFINED, valid_exts:
 
 def get_optional_snowflake(data: typing.Dict[str, typing.Any], key: str) -> typing.Optional[int]:
     """Helper to obtain optional or nullable snowflakes from a raw payload."""
+    value = data.get(key)
+
+    if value is None:
+        return None
+    if type(value) is int:
+        return value
+
     try:
-        return int(data[key])
-    except (KeyError, ValueError, TypeError):
+        return int(value)
+    except (ValueError, TypeError):
         return None
 
 def compute_shard_id(guild_id: int, shards_count: int) -> int:
@@ -84,23 +113,27 @@ def compute_shard_id(guild_id: int, shards_count: int) -> int:
 
 def get_image_data(img_bytes: bytes) -> str:
     """Gets Data URI format for provided image bytes."""
-
-    if img_bytes.startswith(b"\x89\x50\x4E\x47\x0D\x0A\x1A\x0A"):
-        content_type = "image/png"
-    elif img_bytes[0:3] == b"\xff\xd8\xff" or img_bytes[6:10] in (b"JFIF", b"Exif"):
-        content_type = "image/jpeg"
-    elif img_bytes.startswith((b"\x47\x49\x46\x38\x37\x61", b"\x47\x49\x46\x38\x39\x61")):
-        content_type = "image/gif"
+    if img_bytes.startswith(_PNG_SIGNATURE):
+        prefix = _PNG_DATA_PREFIX
+    elif img_bytes[:3] == b"\xff\xd8\xff" or img_bytes[6:10] in _JPEG_MARKERS:
+        prefix = _JPEG_DATA_PREFIX
+    elif img_bytes.startswith(_GIF_SIGNATURES):
+        prefix = _GIF_DATA_PREFIX
     elif img_bytes.startswith(b"RIFF") and img_bytes[8:12] == b"WEBP":
-        content_type = "image/webp"
+        prefix = _WEBP_DATA_PREFIX
     else:
         raise TypeError("Invalid image type was provided.")
 
-    return f"data:{content_type};base64,{b64encode(img_bytes).decode('ascii')}"
+    return prefix + b64encode(img_bytes).decode("ascii")
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
 
 def parse_iso_timestamp(timestamp: str) -> datetime:
     """Parse ISO timestamp string to a datetime.datetime instance."""
-    return datetime.fromisoformat(timestamp)
+    return _parse_datetime(timestamp)
 
 def compute_creation_time(snowflake: int) -> datetime:
     """Computes the creation time of the given snowflake as UTC timezone aware datetime."""
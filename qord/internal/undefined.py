@@ -30,14 +30,31 @@ __all__ = (
 
 
 class _Undefined:
-    def __bool__(self) -> bool:
-        return False
+    __slots__ = ()
+
+    _instance: typing.ClassVar[typing.Optional[_Undefined]] = None
+
+    def __new__(cls) -> _Undefined:
+        # Only a single instance is ever created so that the
+        # sentinel can always be compared by identity.
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
-    def __eq__(self, o: object) -> bool:
+    def __bool__(self) -> bool:
         return False
 
     def __repr__(self) -> str:
         return "..."
 
+    def __reduce__(self) -> str:
+        return "UNDEFINED"
+
+    def __copy__(self) -> _Undefined:
+        return self
+
+    def __deepcopy__(self, memo: typing.Any) -> _Undefined:
+        return self
+
 UNDEFINED: typing.Any = _Undefined()
-"""A sentinel used at places where None is ambiguous"""
\ No newline at end of file
+"""A sentinel used at places where None is ambiguous"""
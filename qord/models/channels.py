@@ -553,6 +553,7 @@ class TextChannel(GuildChannel, BaseMessageChannel):
         "nsfw",
         "last_pin_timestamp",
     )
+    _is_message_channel = True
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
         super()._update_with_data(data)
@@ -813,6 +814,7 @@ class VoiceChannel(GuildChannel, BaseMessageChannel):
         "last_message_id",
         "slowmode_delay",
     )
+    _is_message_channel = True
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
         super()._update_with_data(data)
@@ -1215,6 +1217,7 @@ class DMChannel(PrivateChannel, BaseMessageChannel):
         "last_pin_timestamp",
         "recipient"
     )
+    _is_message_channel = True
 
     def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
         super()._update_with_data(data)
@@ -176,13 +176,31 @@ class GuildMember(BaseModel, Comparable):
     __slots__ = ("guild", "_client", "user", "nickname", "guild_avatar", "deaf", "mute", "pending",
                 "joined_at", "premium_since", "timeout_until", "role_ids", "roles")
 
-    def __init__(self, data: typing.Dict[str, typing.Any], guild: Guild) -> None:
+    def __init__(self, data: typing.Dict[str, typing.Any], guild: Guild, *, _share_user: bool = False) -> None:
         self.guild = guild
         self._client = guild._client
-        self._update_with_data(data)
+        self._update_with_data(data, _share_user=_share_user)
 
-    def _update_with_data(self, data: typing.Dict[str, typing.Any]) -> None:
-        self.user = User(data["user"], client=self._client)
+    def _update_with_data(self, data: typing.Dict[str, typing.Any], *, _share_user: bool = False) -> None:
+        user_data = data["user"]
+        user = None
+
+        # Share the cached user between all members of the same user instead
+        # of keeping a separate copy for every guild. This is only done for
+        # complete member payloads so that partial ones (e.g. message authors)
+        # don't overwrite the cached user.
+        if _share_user:
+            user = self._client._cache.get_user(int(user_data["id"]))
+
+            if user is not None and user.__class__ is User:
+                user._update_with_data(user_data)
+            else:
+                user = None
+
+        if user is None:
+            user = User(user_data, client=self._client)
+
+        self.user = user
         self.nickname = data.get("nick")
         self.guild_avatar = data.get("avatar")
         self.deaf = data.get("deaf", False)
@@ -219,6 +219,8 @@ class Guild(BaseModel, Comparable, CreationTime):
     def __init__(self, data: typing.Dict[str, typing.Any], client: Client, enable_cache: bool = False) -> None:
         self._client = client
         self._rest = client._rest
+        # Set early so that the guild cache can access it.
+        self.id = int(data["id"])
         self._cache = client.get_guild_cache(guild=self)
         self._client_cache = client._cache
         if not isinstance(self._cache, GuildCache):
@@ -248,15 +250,17 @@ class Guild(BaseModel, Comparable, CreationTime):
         client = self._client
         client_cache = client._cache
 
-        for raw_member in data.get("members", []):
-            member = GuildMember(raw_member, guild=self)
-            cache.add_member(member)
-            client_cache.add_user(member.user)
+        members = [GuildMember(raw_member, guild=self, _share_user=True) for raw_member in data.get("members", [])]
+        cache.add_members(members)
+        client_cache.add_users([member.user for member in members])
+
+        channels = []
 
         for raw_channel in data.get("channels", []):
             cls = _guild_channel_factory(raw_channel["type"])
-            channel = cls(raw_channel, guild=self)
-            cache.add_channel(channel)
+            channels.append(cls(raw_channel, guild=self))
+
+        cache.add_channels(channels)
 
         for raw_scheduled_event in data.get("guild_scheduled_events", []):
             scheduled_event = ScheduledEvent(raw_scheduled_event, guild=self, client=client)
@@ -324,9 +328,7 @@ class Guild(BaseModel, Comparable, CreationTime):
 
         cache = self._cache
 
-        for raw_role in data.get("roles", []):
-            role = Role(raw_role, guild=self)
-            cache.add_role(role)
+        cache.add_roles([Role(raw_role, guild=self) for raw_role in data.get("roles", [])])
 
         for raw_emoji in data.get("emojis", []):
             emoji = Emoji(raw_emoji, guild=self)
@@ -424,6 +424,8 @@ class Message(BaseModel, Comparable):
             # absent for some reason in MESSAGE_UPDATE event.
             self.type = data["type"]
 
+        get = data.get
+
         self.id = int(data["id"])
         self.channel_id = int(data["channel_id"])
         self.guild_id = guild_id = get_optional_snowflake(data, "guild_id")
@@ -431,19 +433,19 @@ class Message(BaseModel, Comparable):
         self.application_id = get_optional_snowflake(data, "application_id")
         self.created_at = parse_iso_timestamp(data["timestamp"])
         self.guild = self._cache.get_guild(guild_id) if guild_id is not None else None
-        self.content = data.get("content")
-        self.tts = data.get("tts", False)
-        self.flags = MessageFlags(data.get("message_flags", 0))
-        self.mention_everyone = data.get("mention_everyone", False)
-        self.mentioned_role_ids = [int(r) for r in data.get("mention_roles", [])] # Undocumented.
-        self.mentioned_channels = [ChannelMention(c, self) for c in data.get("mention_channels", [])]
-        self.nonce = data.get("nonce")
-        self.pinned = data.get("pinned", False)
-        self.attachments = [Attachment(a, message=self) for a in data.get("attachments", [])]
-        self.embeds = [Embed.from_dict(e) for e in data.get("embeds", [])]
-        self.reactions = [Reaction(r, message=self) for r in data.get("reactions", [])]
-        edited_at = data.get("edited_timestamp")
-        message_reference = data.get("message_reference")
+        self.content = get("content")
+        self.tts = get("tts", False)
+        self.flags = MessageFlags(get("message_flags", 0))
+        self.mention_everyone = get("mention_everyone", False)
+        self.mentioned_role_ids = [int(r) for r in get("mention_roles", ())] # Undocumented.
+        self.mentioned_channels = [ChannelMention(c, self) for c in get("mention_channels", ())]
+        self.nonce = get("nonce")
+        self.pinned = get("pinned", False)
+        self.attachments = [Attachment(a, message=self) for a in get("attachments", ())]
+        self.embeds = [Embed.from_dict(e) for e in get("embeds", ())]
+        self.reactions = [Reaction(r, message=self) for r in get("reactions", ())]
+        edited_at = get("edited_timestamp")
+        message_reference = get("message_reference")
         self.edited_at = parse_iso_timestamp(edited_at) if edited_at is not None else None
         self.message_reference = MessageReference.from_dict(message_reference) if message_reference is not None else None
 
@@ -461,7 +463,7 @@ class Message(BaseModel, Comparable):
         guild = self.guild
         mentions = []
 
-        for user_data in data.get("mentions", []):
+        for user_data in data.get("mentions", ()):
             user_id = int(user_data["id"])
             if "member" in user_data:
                 # Mention is in a guild
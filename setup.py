@@ -14,6 +14,13 @@ with open("requirements.txt", "r") as f:
     while "\n" in REQUIREMENTS:
         REQUIREMENTS.remove("\n")
 
+EXTRAS_REQUIRE = {
+    "speedups": [
+        "ciso8601",
+        "orjson",
+    ],
+}
+
 PACKAGES = [
     "qord",
     "qord.core",
@@ -39,6 +46,7 @@ setup(
     long_description_content_type="text/markdown",
     include_package_data=True,
     install_requires=REQUIREMENTS,
+    extras_require=EXTRAS_REQUIRE,
     packages=PACKAGES,
     python_requires='>=3.8.0',
     classifiers=[
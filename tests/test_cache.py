@@ -0,0 +1,194 @@
+"""Tests for the default cache handlers"""
+
+from qord import (
+    DefaultClientCache,
+    DefaultGuildCache,
+    NullClientCache,
+    DMChannel,
+    Message,
+    TextChannel,
+    User,
+)
+from types import SimpleNamespace
+import unittest
+
+
+def create_message(message_id: int, channel_id: int = 0) -> Message:
+    message = Message.__new__(Message)
+    message.id = message_id
+    message.channel_id = channel_id
+    return message
+
+
+class TestDefaultClientCache(unittest.TestCase):
+    def test_message_cache_eviction(self) -> None:
+        cache = DefaultClientCache(message_limit=3)
+        cache.clear()
+
+        for message_id in range(1, 4):
+            cache.add_message(create_message(message_id))
+
+        # Accessing a message marks it as recently used.
+        assert cache.get_message(1) is not None
+
+        cache.add_message(create_message(4))
+
+        assert cache.get_message(2) is None
+        assert [message.id for message in cache.messages()] == [3, 1, 4]
+
+    def test_message_cache_evicts_single_entry(self) -> None:
+        cache = DefaultClientCache(message_limit=5)
+        cache.clear()
+
+        for message_id in range(1, 7):
+            cache.add_message(create_message(message_id))
+
+        assert len(cache.messages()) == 5
+        assert cache.get_message(1) is None
+        assert all(cache.get_message(message_id) is not None for message_id in range(2, 7))
+
+    def test_message_limit_type(self) -> None:
+        assert DefaultClientCache(message_limit=None).message_limit == 0
+
+        with self.assertRaises(TypeError):
+            DefaultClientCache(message_limit=True)
+
+    def test_user_cache_eviction(self) -> None:
+        cache = DefaultClientCache(user_limit=2)
+        cache.clear()
+        users = []
+
+        for user_id in range(1, 4):
+            user = User.__new__(User)
+            user.id = user_id
+            users.append(user)
+
+        cache.add_user(users[0])
+        cache.add_user(users[1])
+        assert cache.get_user(1) is users[0]
+
+        cache.add_user(users[2])
+
+        assert cache.get_user(2) is None
+        assert [user.id for user in cache.users()] == [1, 3]
+
+    def test_message_limit_setter(self) -> None:
+        cache = DefaultClientCache(message_limit=5)
+        cache.clear()
+
+        for message_id in range(1, 6):
+            cache.add_message(create_message(message_id))
+
+        cache.message_limit = 0
+        assert not cache.message_cache_enabled
+
+        cache.message_limit = 2
+        assert cache.message_cache_enabled
+
+        cache.add_message(create_message(6))
+        assert [message.id for message in cache.messages()] == [5, 6]
+
+    def test_add_users(self) -> None:
+        cache = DefaultClientCache(user_limit=2)
+        cache.clear()
+        users = []
+
+        for user_id in range(1, 4):
+            user = User.__new__(User)
+            user.id = user_id
+            users.append(user)
+
+        cache.add_users(users)
+
+        assert [user.id for user in cache.users()] == [2, 3]
+
+    def test_user_limit(self) -> None:
+        with self.assertRaises(ValueError):
+            DefaultClientCache(user_limit=0)
+
+        with self.assertRaises(TypeError):
+            DefaultClientCache(user_limit=True) # type: ignore
+
+        cache = DefaultClientCache(user_limit=2)
+
+        with self.assertRaises(AttributeError):
+            cache.user_limit = None # type: ignore
+
+    def test_private_channel_cache_eviction(self) -> None:
+        cache = DefaultClientCache()
+        cache.clear()
+        channels = []
+
+        for channel_id in range(257):
+            channel = DMChannel.__new__(DMChannel)
+            channel.id = channel_id
+            channels.append(channel)
+            cache.add_private_channel(channel)
+
+        assert cache.get_private_channel(0) is None
+        assert cache.get_private_channel(1) is channels[1]
+        assert len(cache.private_channels()) == 256
+
+    def test_sweep_messages(self) -> None:
+        cache = DefaultClientCache(message_limit=10)
+        cache.clear()
+
+        for message_id in range(1, 7):
+            cache.add_message(create_message(message_id))
+
+        assert cache.sweep_messages(lambda message: message.id % 2 == 0) == 3
+        assert [message.id for message in cache.messages()] == [1, 3, 5]
+
+    def test_messages_in(self) -> None:
+        cache = DefaultClientCache(message_limit=3)
+        cache.clear()
+
+        cache.add_message(create_message(1, channel_id=10))
+        cache.add_message(create_message(2, channel_id=20))
+        cache.add_message(create_message(3, channel_id=10))
+
+        assert [message.id for message in cache.messages_in(10)] == [1, 3]
+
+        cache.delete_message(3)
+        # Evicts message 1, leaving no messages for channel 10.
+        cache.add_message(create_message(4, channel_id=20))
+        cache.add_message(create_message(5, channel_id=20))
+
+        assert len(cache.messages_in(10)) == 0
+        assert [message.id for message in cache.messages_in(20)] == [2, 4, 5]
+
+
+class TestNullClientCache(unittest.TestCase):
+    def test_nothing_cached(self) -> None:
+        cache = NullClientCache()
+        cache.clear()
+        cache.add_message(create_message(1))
+
+        assert not cache.message_cache_enabled
+        assert cache.get_message(1) is None
+        assert len(cache.messages()) == 0
+
+
+class TestDefaultGuildCache(unittest.TestCase):
+    def test_add_channels(self) -> None:
+        cache = DefaultGuildCache(guild=SimpleNamespace(id=1)) # type: ignore
+        cache.clear()
+        channels = []
+
+        for channel_id in range(1, 4):
+            channel = TextChannel.__new__(TextChannel)
+            channel.id = channel_id
+            channels.append(channel)
+
+        cache.add_channels(channels)
+
+        assert cache.get_channel(2) is channels[1]
+
+        # Type checks are skipped when running with -O.
+        if __debug__:
+            with self.assertRaises(TypeError):
+                cache.add_channels([object()]) # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Tests for the client's event invocation"""
+
+from qord import Client
+import asyncio
+import unittest
+
+
+class DummyEvent:
+    __event_name__ = "dummy_event"
+
+
+class TestInvokeEvent(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_listener_signature(self) -> None:
+        client = Client()
+        called = []
+
+        def bad():
+            pass
+
+        async def good(event):
+            called.append(event)
+
+        client._event_listeners["dummy_event"] = [bad, good]
+        future = asyncio.get_running_loop().create_future()
+        client._event_futures["dummy_event"] = [(lambda event: True, future)]
+
+        event = DummyEvent()
+
+        with self.assertLogs("qord.core.client", level="ERROR"):
+            client.invoke_event(event) # type: ignore
+
+        await asyncio.sleep(0)
+
+        self.assertEqual(called, [event])
+        self.assertIs(future.result(), event)
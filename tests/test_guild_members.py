@@ -0,0 +1,58 @@
+"""Tests for guild members"""
+
+from qord import Client, DefaultGuildCache, GuildMember
+from types import SimpleNamespace
+import unittest
+
+
+def create_member_data(name: str) -> dict:
+    return {
+        "user": {"id": "1", "username": name, "discriminator": "0001"},
+        "joined_at": "2022-01-01T00:00:00+00:00",
+        "roles": [],
+    }
+
+
+class TestGuildMember(unittest.IsolatedAsyncioTestCase):
+    def create_guild(self, client: Client) -> SimpleNamespace:
+        guild = SimpleNamespace(id=1, _client=client)
+        guild._cache = guild.cache = DefaultGuildCache(guild=guild) # type: ignore
+        guild.cache.clear()
+        return guild
+
+    async def test_partial_payload_does_not_update_cached_user(self) -> None:
+        client = Client()
+        client._cache.clear()
+        guild = self.create_guild(client)
+
+        member = GuildMember(create_member_data("before"), guild=guild, _share_user=True) # type: ignore
+        client._cache.add_user(member.user)
+
+        # e.g. a member attached to a message author.
+        partial = GuildMember(create_member_data("stale"), guild=guild) # type: ignore
+
+        self.assertIsNot(partial.user, member.user)
+        self.assertEqual(member.user.name, "before")
+        self.assertIs(client._cache.get_user(1), member.user)
+
+    async def test_member_update_before_user(self) -> None:
+        client = Client()
+        client._cache.clear()
+        guild = self.create_guild(client)
+        client._cache._guilds[guild.id] = guild # type: ignore
+
+        member = GuildMember(create_member_data("before"), guild=guild, _share_user=True) # type: ignore
+        guild.cache.add_member(member)
+        client._cache.add_user(member.user)
+
+        events = []
+        client._dispatch.invoke = events.append
+
+        data = create_member_data("after")
+        data["guild_id"] = "1"
+        await client._dispatch.on_guild_member_update(None, data)
+
+        event, = events
+        self.assertEqual(event.before.user.name, "before")
+        self.assertEqual(event.after.user.name, "after")
+        self.assertIs(client._cache.get_user(1), event.after.user)
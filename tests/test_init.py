@@ -0,0 +1,27 @@
+"""Tests for the package's lazily loaded public names"""
+
+import importlib
+import qord
+import unittest
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_all_matches_submodules(self) -> None:
+        names = set()
+
+        for module, exported in qord._LAZY_MODULES.items():
+            module_all = importlib.import_module(module).__all__
+            assert set(exported) == set(module_all), module
+            names.update(module_all)
+
+        assert set(qord.__all__) == names | set(qord._LAZY_SUBMODULES)
+
+    def test_names_resolve(self) -> None:
+        for name in qord.__all__:
+            assert getattr(qord, name) is not None, name
+
+    def test_submodules_resolve(self) -> None:
+        for name in ("core", "models", "flags", "dataclasses", "exceptions", "enums", "internal"):
+            assert getattr(qord, name) is importlib.import_module(f"qord.{name}"), name
+
+        assert qord.core.client.Client is qord.Client
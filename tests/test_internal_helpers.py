@@ -8,3 +8,73 @@ class TestInternalHelpers(unittest.TestCase):
         creation_time = datetime.datetime(2016, 4, 30, 11, 18, 25, 796000, datetime.timezone.utc)
 
         assert helpers.compute_creation_time(snowflake) == creation_time
+
+    def test_create_cdn_url(self) -> None:
+        base = helpers.BASE_CDN_URL
+
+        assert helpers.create_cdn_url("/icons/1/abc", "png") == f"{base}/icons/1/abc.png"
+        assert helpers.create_cdn_url("/icons/1/abc", "PNG") == f"{base}/icons/1/abc.PNG"
+        assert helpers.create_cdn_url(
+            "/icons/1/abc", "gif", valid_exts=helpers.BASIC_EXTS
+        ) == f"{base}/icons/1/abc.gif"
+
+        with self.assertRaises(ValueError):
+            helpers.create_cdn_url("/icons/1/abc", "gif")
+
+    def test_create_cdn_url_size(self) -> None:
+        base = helpers.BASE_CDN_URL
+
+        for size in (64, 128, 1024, 4096):
+            assert helpers.create_cdn_url("/icons/1/abc", "png", size) == f"{base}/icons/1/abc.png?size={size}"
+
+        for size in (0, 1, 32, 100, 8192):
+            with self.assertRaises(ValueError):
+                helpers.create_cdn_url("/icons/1/abc", "png", size)
+
+    def test_get_image_data(self) -> None:
+        images = {
+            b"\x89PNG\r\n\x1a\n0000": "image/png",
+            b"GIF89a0000": "image/gif",
+            b"\xff\xd8\xff\xe00000": "image/jpeg",
+            b"RIFF0000WEBP": "image/webp",
+        }
+
+        for data, content_type in images.items():
+            assert helpers.get_image_data(data).startswith(f"data:{content_type};base64,")
+
+        with self.assertRaises(TypeError):
+            helpers.get_image_data(b"invalid")
+
+        with self.assertRaises(TypeError):
+            helpers.get_image_data(b"GIF80a0000")
+
+        assert helpers.get_image_data(bytearray(b"GIF87a1111")).startswith("data:image/gif;base64,")
+
+    def test_get_image_data_bytearray(self) -> None:
+        data = b"\x89PNG\r\n\x1a\nbytearray"
+
+        assert helpers.get_image_data(bytearray(data)) == helpers.get_image_data(data)
+
+    def test_parse_iso_timestamp(self) -> None:
+        timestamp = "2022-03-27T15:07:43.123000+00:00"
+        time = datetime.datetime(2022, 3, 27, 15, 7, 43, 123000, datetime.timezone.utc)
+
+        assert helpers.parse_iso_timestamp(timestamp) == time
+
+    def test_compute_shard_id(self) -> None:
+        guild_id = 175928847299117063
+
+        for shards_count in (1, 2, 3, 8, 10, 16):
+            assert helpers.compute_shard_id(guild_id, shards_count) == (guild_id >> 22) % shards_count
+
+        with self.assertRaises(ZeroDivisionError):
+            helpers.compute_shard_id(guild_id, 0)
+
+    def test_get_optional_snowflake(self) -> None:
+        data = {"id": "175928847299117063", "int_id": 175928847299117063, "null_id": None, "invalid_id": "abc"}
+
+        assert helpers.get_optional_snowflake(data, "id") == 175928847299117063
+        assert helpers.get_optional_snowflake(data, "int_id") == 175928847299117063
+        assert helpers.get_optional_snowflake(data, "null_id") is None
+        assert helpers.get_optional_snowflake(data, "invalid_id") is None
+        assert helpers.get_optional_snowflake(data, "missing_id") is None
@@ -0,0 +1,42 @@
+"""Tests for the gateway shard"""
+
+from qord.core.shard import Shard
+from types import SimpleNamespace
+import json
+import unittest
+import zlib
+
+
+class FakeWebsocket:
+    def __init__(self, frames) -> None:
+        self.frames = list(frames)
+
+    async def receive(self) -> SimpleNamespace:
+        return SimpleNamespace(data=self.frames.pop(0))
+
+
+class TestShard(unittest.IsolatedAsyncioTestCase):
+    async def test_split_payload(self) -> None:
+        dispatched = []
+
+        async def handle(shard, event, data):
+            dispatched.append((event, data))
+
+        client = SimpleNamespace(_rest=None, _dispatch=SimpleNamespace(handle=handle))
+        shard = Shard(0, client) # type: ignore
+
+        payload = {"op": 0, "s": 1, "t": "TYPING_START", "d": {"user_id": "1"}}
+        compressor = zlib.compressobj()
+        data = compressor.compress(json.dumps(payload).encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        middle = len(data) // 2
+
+        shard._inflator = zlib.decompressobj()
+        shard._websocket = FakeWebsocket([data[:middle], data[middle:]]) # type: ignore
+
+        # The first fragment must not be treated as the shard closing.
+        self.assertIs(await shard._handle_recv(), True)
+        self.assertEqual(dispatched, [])
+
+        self.assertIs(await shard._handle_recv(), True)
+        self.assertEqual(dispatched, [("TYPING_START", {"user_id": "1"})])
+        self.assertEqual(shard._sequence, 1)